@@ -1,8 +1,8 @@
 import os
 import json
-import base64
 import asyncio
 import websockets
+import orjson
 from fastapi import FastAPI, WebSocket, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.websockets import WebSocketDisconnect
@@ -79,14 +79,14 @@ async def handle_media_stream(websocket: WebSocket):
             nonlocal stream_sid, latest_media_timestamp
             try:
                 async for message in websocket.iter_text():
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     if data['event'] == 'media' and openai_ws.open:
                         latest_media_timestamp = int(data['media']['timestamp'])
                         audio_append = {
                             "type": "input_audio_buffer.append",
                             "audio": data['media']['payload']
                         }
-                        await openai_ws.send(json.dumps(audio_append))
+                        await openai_ws.send(orjson.dumps(audio_append).decode('utf-8'))
                     elif data['event'] == 'start':
                         stream_sid = data['start']['streamSid']
                         print(f"Incoming stream has started {stream_sid}")
@@ -106,17 +106,16 @@ async def handle_media_stream(websocket: WebSocket):
             nonlocal stream_sid, last_assistant_item, response_start_timestamp_twilio
             try:
                 async for openai_message in openai_ws:
-                    response = json.loads(openai_message)
+                    response = orjson.loads(openai_message)
                     if response['type'] in LOG_EVENT_TYPES:
                         print(f"Received event: {response['type']}", response)
 
                     if response.get('type') == 'response.audio.delta' and 'delta' in response:
-                        audio_payload = base64.b64encode(base64.b64decode(response['delta'])).decode('utf-8')
                         audio_delta = {
                             "event": "media",
                             "streamSid": stream_sid,
                             "media": {
-                                "payload": audio_payload
+                                "payload": response['delta']
                             }
                         }
                         await websocket.send_json(audio_delta)
@@ -216,8 +215,9 @@ async def initialize_session(openai_ws):
             "temperature": 0.8,
         }
     }
-    print('Sending session update:', json.dumps(session_update))
-    await openai_ws.send(json.dumps(session_update))
+    session_update_json = json.dumps(session_update)
+    print('Sending session update:', session_update_json)
+    await openai_ws.send(session_update_json)
 
     # Uncomment the next line to have the AI speak first
     # await send_initial_conversation_item(openai_ws)